@@ -53,18 +53,19 @@ class GeometricWidthDiscretiser(BaseDiscretiser):
     The constant amount is calculated as:
 
         .. math::
-            cw = (Max - Min)^{power}
+            cw = (Max - Min + 1)^{power}
 
     were Max and Min are the variable's maximum and minimum value, and n is the number
     of intervals.
 
-    The sizes of the intervals themselves are calculated with a geometric progression:
+    The interval limits are Min + a_i - 1, where a_i is a geometric progression that
+    starts at a_0 = 1:
 
         .. math::
             a_{subindex} = a_i cw
 
-    Thus, the first interval's width equals cw, the second interval's width equals
-    2 * cw, and so on.
+    Thus, the first interval's width equals cw - 1, the second interval's width equals
+    (cw - 1) * cw, and so on, until the last limit, which equals Max.
 
     Note that the proportion of observations per interval may vary.
 
@@ -161,17 +162,69 @@ class GeometricWidthDiscretiser(BaseDiscretiser):
         # check input dataframe
         X = super().fit(X)
 
-        # fit
-        self.binner_dict_ = {}
-
-        for var in self.variables_:
-            min_, max_ = X[var].min(), X[var].max()
-            increment = np.power(max_ - min_, 1.0 / self.bins)
-            bins = np.r_[
-                -np.inf, min_ + np.power(increment, np.arange(1, self.bins)), np.inf
-            ]
-            bins = np.sort(bins)
-            bins = list(bins)
-            self.binner_dict_[var] = bins
+        if self.bins == 1:
+            # a single interval contains all values, whatever the data
+            self.binner_dict_ = {var: [-np.inf, np.inf] for var in self.variables_}
+        else:
+            # fit all variables at once, one row per variable
+            values = X[self.variables_].to_numpy(dtype=np.float64)
+            min_, max_ = values.min(axis=0), values.max(axis=0)
+            # limits go from min to max, and their distance to (min - 1) grows
+            # geometrically from 1 to (max - min + 1)
+            offsets = np.geomspace(1, max_ - min_ + 1, self.bins + 1, axis=1) - 1
+            limits = min_[:, None] + offsets
+
+            self.binner_dict_ = {
+                var: [-np.inf] + list(var_limits[1:-1]) + [np.inf]
+                for var, var_limits in zip(self.variables_, limits)
+            }
 
         return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Sort the variable values into the intervals.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The data to transform.
+
+        Returns
+        -------
+        X_new: pandas dataframe of shape = [n_samples, n_features]
+            The transformed data with the discrete variables.
+        """
+
+        # intervals are returned as labels formatted by pd.cut()
+        if self.return_boundaries is True:
+            return super().transform(X)
+
+        # check input dataframe and if class was fitted
+        X = self._check_transform_input_and_state(X)
+
+        # same intervals as pd.cut(include_lowest=True): closed on the right, and
+        # the first one also contains the lowest limit
+        for feature in self.variables_:
+            breaks = np.asarray(self.binner_dict_[feature], dtype=float)
+            # same checks as pd.cut(), ie, a variable with a single value in fit
+            # has repeated limits
+            if np.any(np.diff(breaks) < 0):
+                raise ValueError("bins must increase monotonically.")
+            if np.any(np.diff(breaks) == 0):
+                raise ValueError(f"Bin edges must be unique: {breaks!r}.")
+            values = X[feature].to_numpy(dtype=float)
+            codes = np.asarray(breaks.searchsorted(values)) - 1
+            codes[values == breaks[0]] = 0
+            # values outside the limits, which the user may have edited to be
+            # finite, are not in any interval
+            outside = (values < breaks[0]) | (values > breaks[-1])
+            if outside.any():
+                codes = codes.astype(float)
+                codes[outside] = np.nan
+            X[feature] = codes
+
+        # return object
+        if self.return_object:
+            X[self.variables_] = X[self.variables_].astype("O")
+
+        return X
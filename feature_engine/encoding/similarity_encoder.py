@@ -1,8 +1,10 @@
 from difflib import SequenceMatcher
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import csr_matrix
 from sklearn.utils.validation import check_is_fitted
 
 from feature_engine._docstrings.fit_attributes import (
@@ -22,12 +24,134 @@ from feature_engine.encoding.base_encoder import (
     CategoricalMethodsMixin,
 )
 
+# unicode code points take up to 21 bits, the remaining bits of 64-bit integers
+# store which string, or which repetition of a character, a code point belongs to
+_CODE_BITS = 21
+_CODE_MASK = (1 << _CODE_BITS) - 1
 
-def _gpm_fast(x1: str, x2: str) -> float:
-    return SequenceMatcher(None, str(x1), str(x2)).quick_ratio()
 
+# scalar reference of the similarity, that _gpm_sparse() must match
+def _gpm_fast(x1: str, x2: str, min_sim: float = 0.0) -> float:
+    similarity = SequenceMatcher(None, str(x1), str(x2)).quick_ratio()
+    return similarity if similarity >= min_sim else 0.0
 
-_gpm_fast_vec = np.vectorize(_gpm_fast)
+
+def _encode_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the sorted unicode code points of all strings concatenated in one array,
+    and the offsets where each string starts and ends in that array.
+    """
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in strings], out=offsets[1:])
+    codes = np.frombuffer(
+        "".join(strings).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    # sort the code points of all strings at once, by string and then by code point
+    rows = np.repeat(np.arange(len(strings), dtype=np.int64), np.diff(offsets))
+    keys = np.sort((rows << _CODE_BITS) | codes)
+    return (keys & _CODE_MASK).astype(np.uint32), offsets
+
+
+def _occurrence_tokens(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the characters of all strings concatenated in one array of integer
+    tokens, and the offsets where each string starts and ends in that array. The
+    n-th repetition of a character within a string is a token on its own, ie,
+    "dagger" becomes a1, d1, e1, g1, g2, r1.
+    """
+    codes, offsets = _encode_strings(strings)
+    # as the code points of each string are sorted, the repetitions of a character
+    # are contiguous, and their rank is their distance to the first one
+    position = np.arange(len(codes))
+    first = np.ones(len(codes), dtype=bool)
+    first[1:] = codes[1:] != codes[:-1]
+    first[offsets[:-1][np.diff(offsets) > 0]] = True
+    rank = position - np.maximum.accumulate(np.where(first, position, 0))
+    return (rank << _CODE_BITS) | codes, offsets
+
+
+def _occurrence_matrix(
+    tokens: np.ndarray, offsets: np.ndarray, vocabulary: np.ndarray
+) -> csr_matrix:
+    """
+    Sparse binary matrix of shape [n_strings, n_tokens] with the tokens of each
+    string, as returned by `_occurrence_tokens()`. As the repetitions of a character
+    are different tokens, the dot product between two rows is the number of
+    characters both strings have in common, allowing for repetitions.
+
+    vocabulary is the sorted array of tokens that are columns of the matrix. Other
+    tokens are ignored.
+    """
+    columns = np.asarray(vocabulary.searchsorted(tokens))
+    found = columns < len(vocabulary)
+    found[found] = vocabulary[columns[found]] == tokens[found]
+    indptr = np.zeros(len(tokens) + 1, dtype=np.int64)
+    np.cumsum(found, out=indptr[1:])
+
+    return csr_matrix(
+        (np.ones(indptr[-1]), columns[found], indptr[offsets]),
+        shape=(len(offsets) - 1, len(vocabulary)),
+    )
+
+
+def _gpm_sparse(
+    categories: List[str],
+    references: List[str],
+    min_sim: float = 0.0,
+    encoded_references: Optional[tuple] = None,
+) -> np.ndarray:
+    """
+    Return the similarity between each category and each reference as an array of
+    shape [n_categories, n_references]. It returns the same values as `_gpm_fast()`,
+    but computes the matching characters of all pairs with one sparse matrix
+    product.
+    """
+    if encoded_references is None:
+        encoded_references = _encode_references(references)
+    vocabulary, ref_matrix = encoded_references
+    cat_matrix = _occurrence_matrix(*_occurrence_tokens(categories), vocabulary)
+    matches = (cat_matrix @ ref_matrix.T).toarray()
+
+    lengths = np.add.outer(
+        np.array([len(x) for x in categories], dtype=np.float64),
+        np.array([len(x) for x in references], dtype=np.float64),
+    )
+    # same as quick_ratio(), two empty strings are a perfect match
+    similarity = np.ones(matches.shape)
+    np.divide(2.0 * matches, lengths, out=similarity, where=lengths > 0)
+    similarity[similarity < min_sim] = 0.0
+    return similarity.astype(np.float32)
+
+
+def _encode_references(references: List[str]) -> Tuple[np.ndarray, csr_matrix]:
+    """
+    Return the sorted token vocabulary of the references, and their occurrence
+    matrix, so that they can be built once and reused to compare the references
+    with different sets of categories.
+    """
+    tokens, offsets = _occurrence_tokens([str(x) for x in references])
+    vocabulary = np.unique(tokens)
+    return vocabulary, _occurrence_matrix(tokens, offsets, vocabulary)
+
+
+def _gpm_matrix(
+    categories: List[str],
+    references: List[str],
+    min_sim: float = 0.0,
+    encoded_references: Optional[tuple] = None,
+) -> np.ndarray:
+    """
+    Return the similarity between each category and each reference as a float32
+    array of shape [n_categories, n_references]. Similarities below min_sim are set
+    to 0.
+
+    encoded_references is the output of `_encode_references(references)`. If None,
+    the references are encoded in each call.
+    """
+    categories = [str(x) for x in categories]
+    references = [str(x) for x in references]
+
+    return _gpm_sparse(categories, references, min_sim, encoded_references)
 
 
 @Substitution(
@@ -122,6 +246,15 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
     {ignore_format}
 
+    min_sim: float, default=0.0
+        Similarities below this value are set to 0. The default, 0, keeps all
+        similarities.
+
+    n_jobs: int, default=1
+        The number of jobs to run in parallel to compute the similarity between the
+        categories. The jobs run in threads. None means 1 and -1 means using all
+        processors.
+
     Attributes
     ----------
     encoder_dict_:
@@ -150,6 +283,13 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
     No text preprocessing is applied before calculating the similarity.
 
+    The similarity does not depend on the order of the characters. For example, the
+    similarity between "dog" and "god" is 1. This is the `quick_ratio()` of
+    `difflib.SequenceMatcher`, not the ratio of the longest matching subsequences.
+
+    The similarity variables are returned as float32, which is enough precision for
+    values between 0 and 1, and takes half the memory of float64.
+
     The original categorical variables are removed from the returned dataset after the
     transformation. In their place, the binary variables are returned.
 
@@ -188,6 +328,8 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         missing_values: str = "impute",
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         ignore_format: bool = False,
+        min_sim: float = 0.0,
+        n_jobs: Optional[int] = 1,
     ):
         if top_categories and not isinstance(top_categories, int):
             raise ValueError(
@@ -207,10 +349,24 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
                 "The items in keywords should be lists."
                 f" Got {keywords.values()!r} instead."
             )
+        if (
+            not isinstance(min_sim, (int, float, np.integer, np.floating))
+            or isinstance(min_sim, bool)
+            or not 0 <= min_sim <= 1
+        ):
+            raise ValueError(
+                f"min_sim takes values between 0 and 1. Got {min_sim!r} instead."
+            )
+        if n_jobs is not None and (not isinstance(n_jobs, int) or n_jobs == 0):
+            raise ValueError(
+                f"n_jobs takes only non-zero integers or None. Got {n_jobs!r} instead."
+            )
         super().__init__(variables, ignore_format)
         self.top_categories = top_categories
         self.missing_values = missing_values
         self.keywords = keywords
+        self.min_sim = min_sim
+        self.n_jobs = n_jobs
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -243,6 +399,34 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         if self.missing_values == "raise":
             _check_optional_contains_na(X, variables_)
 
+        if self.missing_values not in ("raise", "impute", "ignore"):
+            raise ValueError(
+                "Unrecognized value for missing_values. It should be 'raise', 'ignore' "
+                f"or 'impute'. Got {self.missing_values} instead."
+            )
+
+        # unique categories per variable, sorted by frequency
+        categories = {}
+        for var in variables_:
+            # factorize() uses the integer codes of categorical variables, and only
+            # the unique values need to be cast to string
+            codes, uniques = pd.factorize(X[var], use_na_sentinel=False)
+            counts = pd.Series(
+                np.bincount(codes, minlength=len(uniques)), index=uniques.astype(str)
+            )
+
+            if self.missing_values == "impute":
+                counts = counts.rename(index={"nan": ""})
+            elif self.missing_values == "ignore":
+                counts = counts.drop("nan", errors="ignore")
+
+            # different values may be the same string, ie, 1 and "1"
+            counts = counts.groupby(level=0, sort=False).sum()
+            # the stable sort keeps equally frequent categories in order of appearance
+            categories[var] = counts.sort_values(
+                ascending=False, kind="stable"
+            ).index.tolist()
+
         self.encoder_dict_ = {}
 
         if self.keywords:
@@ -251,40 +435,39 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         else:
             cols_to_iterate = variables_
 
-        if self.missing_values == "raise":
-            for var in cols_to_iterate:
-                self.encoder_dict_[var] = (
-                    X[var]
-                    .astype(str)
-                    .value_counts()
-                    .head(self.top_categories)
-                    .index.tolist()
-                )
-        elif self.missing_values == "impute":
-            for var in cols_to_iterate:
-                self.encoder_dict_[var] = (
-                    X[var]
-                    .astype(str)
-                    .replace("nan", "")
-                    .value_counts()
-                    .head(self.top_categories)
-                    .index.tolist()
-                )
-        elif self.missing_values == "ignore":
-            for var in cols_to_iterate:
-                self.encoder_dict_[var] = (
-                    X[var]
-                    .astype(str)
-                    .value_counts(dropna=True)
-                    .drop("nan", errors="ignore")
-                    .head(self.top_categories)
-                    .index.tolist()
-                )
-        else:
-            raise ValueError(
-                "Unrecognized value for missing_values. It should be 'raise', 'ignore' "
-                f"or 'impute'. Got {self.missing_values} instead."
-            )
+        for var in cols_to_iterate:
+            self.encoder_dict_[var] = categories[var][: self.top_categories]
+
+        # The encoding categories are compared with the unseen categories in every
+        # call to transform(), so we encode them only once, here. Variables with
+        # the same encoding categories share them.
+        shared_encoding: Dict[tuple, tuple] = {}
+        for var in variables_:
+            references = tuple(self.encoder_dict_[var])
+            if references not in shared_encoding:
+                shared_encoding[references] = _encode_references(list(references))
+        self._encoded_references_ = {
+            var: shared_encoding[tuple(self.encoder_dict_[var])] for var in variables_
+        }
+
+        # The similarity of the categories seen in fit to the encoding categories
+        # does not change after fit. We compute it once here, and reuse it in every
+        # call to transform(), which then only needs to compute the similarity of
+        # unseen categories. Variables with the same encoding categories share
+        # their similarities.
+        shared_sim: Dict[tuple, dict] = {}
+        self._fitted_sim_ = {
+            var: self._update_similarity(shared_sim, categories[var], var)
+            for var in variables_
+        }
+
+        # names of the created features, computed once for transform() and
+        # get_feature_names_out()
+        self._new_features_names_ = [
+            f"{feature}_nan" if category == "" else f"{feature}_{category}"
+            for feature in variables_
+            for category in self.encoder_dict_[feature]
+        ]
 
         # assign underscore parameters at the end in case code above fails
         self.variables_ = variables_
@@ -304,8 +487,8 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         -------
         X_new: pandas dataframe.
             The transformed dataframe. The shape of the dataframe will be different from
-            the original as it includes the similarity variables in place of the
-            original categorical ones.
+            the original as it includes the similarity variables, of type float32, in
+            place of the original categorical ones.
         """
 
         check_is_fitted(self)
@@ -313,36 +496,85 @@ class StringSimilarityEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         if self.missing_values == "raise":
             _check_optional_contains_na(X, self.variables_)
 
-        new_values = []
+        n_features = sum(len(self.encoder_dict_[var]) for var in self.variables_)
+        encoded = np.empty((X.shape[0], n_features), dtype=np.float32)
+        start = 0
+        # similarities of unseen categories, shared by variables with the same
+        # encoding categories
+        shared_sim: Dict[tuple, dict] = {}
         for var in self.variables_:
+            # codes index the unique values, and are -1 for missing values
+            codes, uniques = pd.factorize(X[var])
+            uniques = uniques.astype(str).tolist()
             if self.missing_values == "impute":
-                X[var] = X[var].astype(str).replace("nan", "")
-            categories = X[var].dropna().astype(str).unique()
-            column_encoder_dict = {
-                x: _gpm_fast_vec(x, self.encoder_dict_[var]) for x in categories
-            }
-            column_encoder_dict["nan"] = [np.nan] * len(self.encoder_dict_[var])
-            encoded = np.vstack(X[var].astype(str).map(column_encoder_dict).values)
-            if self.missing_values == "ignore":
-                encoded[X[var].isna(), :] = np.nan
-            new_values.append(encoded)
-
-        new_features = self._get_new_features_name()
-        X.loc[:, new_features] = np.hstack(new_values)
-
-        return X.drop(self.variables_, axis=1)
+                # missing values are encoded as an empty string
+                uniques = ["" if x == "nan" else x for x in uniques] + [""]
+            elif "nan" in uniques:
+                # the string "nan" is a missing value too, as in fit()
+                codes[codes == uniques.index("nan")] = -1
+            fitted_sim = self._fitted_sim_[var]
+            novel_sim = self._update_similarity(
+                shared_sim, [x for x in uniques if x not in fitted_sim], var
+            )
+            # one row per unique value, plus a last row for the missing values, so
+            # that all rows are gathered by code in a single pass over the data
+            rows = [fitted_sim[x] if x in fitted_sim else novel_sim[x] for x in uniques]
+            if self.missing_values != "impute":
+                rows.append(
+                    np.full(len(self.encoder_dict_[var]), np.nan, dtype=np.float32)
+                )
+            lookup = np.vstack(rows)
+            stop = start + len(self.encoder_dict_[var])
+            np.take(lookup, codes, axis=0, out=encoded[:, start:stop])
+            start = stop
+
+        X_new = pd.concat(
+            [
+                X.drop(self.variables_, axis=1),
+                pd.DataFrame(
+                    encoded, index=X.index, columns=self._get_new_features_name()
+                ),
+            ],
+            axis=1,
+        )
+        return X_new
+
+    def _update_similarity(
+        self, shared_sim: Dict[tuple, dict], categories: List[str], var
+    ) -> dict:
+        """
+        Add the similarities of the categories to the encoding categories of var that
+        are not yet in shared_sim, and return all similarities to those categories.
+        """
+        similarity = shared_sim.setdefault(tuple(self.encoder_dict_[var]), {})
+        novel = [x for x in dict.fromkeys(categories) if x not in similarity]
+        similarity.update(zip(novel, self._similarity(novel, var)))
+        return similarity
+
+    def _similarity(self, categories: List[str], var) -> np.ndarray:
+        """
+        Return the similarity between each category and each encoding category of
+        var. The categories are split in chunks, one per job, which are processed in
+        threads.
+        """
+        references = self.encoder_dict_[var]
+        encoded_references = self._encoded_references_[var]
+        n_jobs = min(effective_n_jobs(self.n_jobs), len(categories))
+        if n_jobs <= 1:
+            return _gpm_matrix(categories, references, self.min_sim, encoded_references)
+
+        chunks = np.array_split(np.array(categories, dtype=object), n_jobs)
+        similarity = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_gpm_matrix)(
+                chunk.tolist(), references, self.min_sim, encoded_references
+            )
+            for chunk in chunks
+        )
+        return np.vstack(similarity)
 
     def _get_new_features_name(self) -> List[str]:
         """Return names of the created features."""
-        feature_names = []
-        for feature in self.variables_:
-            for category in self.encoder_dict_[feature]:
-                if category == "":
-                    feature_names.append(f"{feature}_nan")
-                else:
-                    feature_names.append(f"{feature}_{category}")
-
-        return feature_names
+        return list(self._new_features_names_)
 
     def _add_new_feature_names(self, feature_names: List[str]) -> List[str]:
         """Creates new features names and removes original categorical variables."""
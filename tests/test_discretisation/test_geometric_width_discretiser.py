@@ -51,12 +51,11 @@ def test_fit_and_transform_methods(df_normal_dist):
 
     # manual calculation
     min_, max_ = df_normal_dist["var"].min(), df_normal_dist["var"].max()
-    increment = np.power(max_ - min_, 1.0 / 10)
-    bins = np.r_[-np.inf, min_ + np.power(increment, np.arange(1, 10)), np.inf]
-    bins = np.sort(bins)
+    increment = np.power(max_ - min_ + 1, 1.0 / 10)
+    bins = np.r_[-np.inf, min_ - 1 + np.power(increment, np.arange(1, 10)), np.inf]
 
     # fit params
-    assert (transformer.binner_dict_["var"] == bins).all()
+    assert np.allclose(transformer.binner_dict_["var"], bins)
 
     # transform params
     assert (
@@ -64,6 +63,63 @@ def test_fit_and_transform_methods(df_normal_dist):
     ).all()
 
 
+def test_limits_increase_geometrically_within_range():
+    # a range smaller than 1 used to return limits greater than the maximum
+    X = pd.DataFrame({"var": np.linspace(2, 2.5, 50)})
+    transformer = GeometricWidthDiscretiser(bins=5).fit(X)
+    limits = np.array(transformer.binner_dict_["var"][1:-1])
+    widths = np.diff(np.r_[2, limits, 2.5])
+
+    assert ((limits > 2) & (limits < 2.5)).all()
+    assert np.allclose(widths[1:] / widths[:-1], 1.5 ** (1 / 5))
+
+
+def test_transform_values_on_interval_limits():
+    X = pd.DataFrame({"var": np.linspace(0, 100, 101)})
+    transformer = GeometricWidthDiscretiser(bins=4).fit(X)
+    limits = transformer.binner_dict_["var"]
+    X_test = pd.DataFrame({"var": [0.0] + limits[1:-1] + [99.9, 100.0, 150.0]})
+
+    Xt = transformer.transform(X_test)
+    expected = pd.cut(X_test["var"], limits, labels=False, include_lowest=True)
+    assert (Xt["var"] == expected).all()
+    assert Xt["var"].dtype == expected.dtype
+
+
+def test_single_bin(df_normal_dist):
+    transformer = GeometricWidthDiscretiser(bins=1)
+    X = transformer.fit_transform(df_normal_dist)
+    assert transformer.binner_dict_ == {"var": [-np.inf, np.inf]}
+    assert (X["var"] == 0).all()
+
+
+def test_transform_uses_edited_limits():
+    X = pd.DataFrame({"var": np.linspace(0, 100, 101)})
+    transformer = GeometricWidthDiscretiser(bins=4).fit(X)
+    transformer.binner_dict_["var"] = [-np.inf, 10, 50, np.inf]
+    Xt = transformer.transform(pd.DataFrame({"var": [5, 10, 30, 70]}))
+    assert Xt["var"].tolist() == [0, 0, 1, 2]
+
+    # finite outer limits, values outside them are not in any interval
+    limits = [0, 10, 50, 100]
+    transformer.binner_dict_["var"] = limits
+    X_test = pd.DataFrame({"var": [-5, 0, 5, 100, 150]})
+    Xt = transformer.transform(X_test)
+    expected = pd.cut(X_test["var"], limits, labels=False, include_lowest=True)
+    pd.testing.assert_series_equal(Xt["var"], expected)
+    assert Xt["var"].isna().tolist() == [True, False, False, False, True]
+
+
+@pytest.mark.parametrize("return_boundaries", [False, True])
+def test_error_if_variable_is_constant(return_boundaries):
+    X = pd.DataFrame({"var": [3.0] * 10})
+    transformer = GeometricWidthDiscretiser(
+        bins=4, return_boundaries=return_boundaries
+    ).fit(X)
+    with pytest.raises(ValueError, match="Bin edges must be unique"):
+        transformer.transform(X)
+
+
 def test_automatically_find_variables_and_return_as_object(df_normal_dist):
     transformer = GeometricWidthDiscretiser(bins=10, variables=None, return_object=True)
     X = transformer.fit_transform(df_normal_dist)
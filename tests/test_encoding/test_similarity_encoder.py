@@ -1,10 +1,18 @@
+import pickle
 from difflib import SequenceMatcher
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from feature_engine.encoding import StringSimilarityEncoder
-from feature_engine.encoding.similarity_encoder import _gpm_fast
+from feature_engine.encoding.similarity_encoder import (
+    _encode_references,
+    _encode_strings,
+    _gpm_fast,
+    _gpm_matrix,
+    _gpm_sparse,
+)
 
 
 @pytest.mark.parametrize(
@@ -17,6 +25,57 @@ def test_gpm_fast(strings):
     )
 
 
+def test_gpm_matrix():
+    categories = ["hola", "chau", "hi there", "", "dagger", 100, "aaab"]
+    references = ["hi here", "dog", "", 1000, "baaa", "zzz"]
+    expected = np.array(
+        [[_gpm_fast(x, r) for r in references] for x in categories], dtype=np.float32
+    )
+    assert np.array_equal(_gpm_matrix(categories, references), expected)
+
+
+def test_encode_strings():
+    codes, offsets = _encode_strings(["dagger", "", "bA", "ñandú"])
+    assert offsets.tolist() == [0, 6, 6, 8, 13]
+    assert "".join(map(chr, codes)) == "adeggr" + "Ab" + "adnñú"
+
+
+def test_gpm_matrix_with_encoded_references():
+    references = ["hi here", "dog", "", 1000, "baaa", "zzz"]
+    encoded_references = _encode_references(references)
+    for categories in [["hola", "chau", 100], ["dagger", "", "aaab", "dug"]]:
+        expected = _gpm_matrix(categories, references)
+        result = _gpm_matrix(categories, references, 0.0, encoded_references)
+        assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("min_sim", [0, 0.3, 0.56, 0.6, 1])
+def test_gpm_sparse(min_sim):
+    # the similarity of "a" * 28 and "a" * 72 is 0.56, but 0.56 * 100 > 56
+    categories = ["hola", "chau", "hi there", "", "dagger", "aaab", "ñandú", "a" * 28]
+    references = ["hi here", "dog", "", "baaa", "zzz", "Ñandu", "a" * 72]
+    expected = np.array(
+        [[_gpm_fast(x, r, min_sim) for r in references] for x in categories],
+        dtype=np.float32,
+    )
+    assert np.array_equal(_gpm_sparse(categories, references, min_sim), expected)
+    assert _gpm_sparse([], references).shape == (0, len(references))
+
+
+def test_similarity_does_not_depend_on_character_order():
+    # quick_ratio() counts common characters, unlike the ratio of the longest
+    # common subsequence, which would be 1/3 for these pairs
+    categories = ["dog", "abc"]
+    references = ["god", "cba"]
+    assert np.array_equal(_gpm_matrix(categories, references), np.eye(2))
+
+
+def test_gpm_fast_min_sim():
+    assert _gpm_fast("dog", "dig", 0.6) == pytest.approx(2 / 3)
+    assert _gpm_fast("dog", "dig", 0.7) == 0
+    assert _gpm_fast("dog", "doggerel", 0.6) == 0
+
+
 def test_encode_top_categories():
     df = pd.DataFrame(
         {
@@ -86,6 +145,34 @@ def test_error_if_top_categories_not_integer(top_cat):
         StringSimilarityEncoder(top_categories=top_cat)
 
 
+@pytest.mark.parametrize("min_sim", ["hello", -0.1, 1.5, None, True])
+def test_error_if_min_sim_not_valid(min_sim):
+    with pytest.raises(ValueError):
+        StringSimilarityEncoder(min_sim=min_sim)
+
+
+@pytest.mark.parametrize("min_sim", [0.5, np.float32(0.5)])
+def test_min_sim(min_sim):
+    df = pd.DataFrame({"var_A": ["dog", "dig", "dagger", "hi", "doggerel", np.nan]})
+    X = StringSimilarityEncoder().fit_transform(df)
+    Xt = StringSimilarityEncoder(min_sim=min_sim).fit_transform(df)
+    assert ((X > 0) & (X < 0.5)).any(axis=None)
+    pd.testing.assert_frame_equal(X.where(X >= 0.5, 0.0), Xt)
+
+
+@pytest.mark.parametrize("n_jobs", ["hello", 0.5, 0])
+def test_error_if_n_jobs_not_valid(n_jobs):
+    with pytest.raises(ValueError):
+        StringSimilarityEncoder(n_jobs=n_jobs)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2, -1])
+def test_n_jobs(df_enc_big_na, n_jobs):
+    X = StringSimilarityEncoder(n_jobs=1).fit_transform(df_enc_big_na)
+    Xt = StringSimilarityEncoder(n_jobs=n_jobs).fit_transform(df_enc_big_na)
+    pd.testing.assert_frame_equal(X, Xt)
+
+
 @pytest.mark.parametrize(
     "handle_missing", ["error", "propagate", ["raise"], 1, 0.1, False]
 )
@@ -406,3 +493,99 @@ def test_get_feature_names_out_w_keywords(df_enc_big_na):
     }
     assert tr.get_feature_names_out(input_features=None) == out
     assert tr.get_feature_names_out(input_features=input_features) == out
+
+
+def test_transform_unseen_categories():
+    train = pd.DataFrame({"var_A": ["dog", "dig", "dog", "cat", "cat", "dog"]})
+    test = pd.DataFrame({"var_A": ["dagger", "cat", "dug", "dagger"]})
+
+    encoder = StringSimilarityEncoder(top_categories=2)
+    X = encoder.fit(train).transform(test)
+
+    assert encoder.encoder_dict_ == {"var_A": ["dog", "cat"]}
+    assert set(encoder._fitted_sim_["var_A"].keys()) == {"dog", "dig", "cat"}
+    expected = pd.DataFrame(
+        [[_gpm_fast(x, r) for r in ["dog", "cat"]] for x in test["var_A"]],
+        columns=["var_A_dog", "var_A_cat"],
+        dtype=np.float32,
+    )
+    pd.testing.assert_frame_equal(X, expected)
+
+
+def test_fit_categorical_and_mixed_type_variables():
+    df = pd.DataFrame(
+        {
+            "var_A": pd.Categorical(["b", "a", "b", "b"], categories=["a", "b", "z"]),
+            "var_B": pd.Series([1, "1", "c", 1], dtype=object),
+        }
+    )
+    encoder = StringSimilarityEncoder(variables=["var_A", "var_B"]).fit(df)
+    assert encoder.encoder_dict_ == {"var_A": ["b", "a"], "var_B": ["1", "c"]}
+
+
+def test_tied_categories_are_sorted_in_order_of_appearance():
+    # more than 16 categories, where an unstable sort would reorder the ties
+    rng = np.random.default_rng(0)
+    categories = [f"c{i}" for i in rng.permutation(40)]
+    df = pd.DataFrame({"var_A": categories + ["z"] * 3 + categories[::-1]})
+    encoder = StringSimilarityEncoder(top_categories=6).fit(df)
+    assert encoder.encoder_dict_ == {"var_A": ["z"] + categories[:5]}
+
+
+@pytest.mark.parametrize(
+    "missing_values, expected",
+    [("impute", ["var_A_a", "var_A_nan"]), ("ignore", ["var_A_a"])],
+)
+def test_none_is_a_missing_value(missing_values, expected):
+    df = pd.DataFrame({"var_A": ["a", None, "a", np.nan]})
+    encoder = StringSimilarityEncoder(missing_values=missing_values).fit(df)
+    assert encoder.get_feature_names_out() == expected
+    X = encoder.transform(df)
+    pd.testing.assert_series_equal(X.iloc[1], X.iloc[3], check_names=False)
+
+
+def test_string_nan_is_a_missing_value_when_ignored():
+    train = pd.DataFrame({"var_A": ["a", "nan", "b", np.nan]})
+    test = pd.DataFrame({"var_A": ["nan", np.nan, "a"]})
+    encoder = StringSimilarityEncoder(missing_values="ignore").fit(train)
+    assert encoder.encoder_dict_ == {"var_A": ["a", "b"]}
+    X = encoder.transform(test)
+    assert X.iloc[:2].isna().all().all()
+    assert X.iloc[2].tolist() == [1.0, 0.0]
+
+
+def test_transform_after_pickling():
+    train = pd.DataFrame({"var_A": ["dog", "dig", "cat"], "var_B": ["a", "b", "a"]})
+    test = pd.DataFrame({"var_A": ["dug", "cat"], "var_B": ["ab", "c"]})
+    encoder = StringSimilarityEncoder().fit(train)
+    encoder_loaded = pickle.loads(pickle.dumps(encoder))
+    pd.testing.assert_frame_equal(
+        encoder_loaded.transform(test), encoder.transform(test)
+    )
+
+
+def test_get_feature_names_out_after_refit():
+    encoder = StringSimilarityEncoder()
+    encoder.fit(pd.DataFrame({"var_A": ["a", "b", "a"]}))
+    assert encoder.get_feature_names_out() == ["var_A_a", "var_A_b"]
+
+    encoder.fit(pd.DataFrame({"var_A": ["c", np.nan, "c"]}))
+    assert encoder.get_feature_names_out() == ["var_A_c", "var_A_nan"]
+
+
+def test_variables_with_same_keywords_share_similarities():
+    train = pd.DataFrame({"var_A": ["dog", "cat"], "var_B": ["dig", "cat"]})
+    test = pd.DataFrame({"var_A": ["dug", "dig"], "var_B": ["dug", "dog"]})
+    keywords = {"var_A": ["dog", "cat"], "var_B": ["dog", "cat"]}
+
+    encoder = StringSimilarityEncoder(keywords=keywords).fit(train)
+    assert encoder._fitted_sim_["var_A"] is encoder._fitted_sim_["var_B"]
+    assert (
+        encoder._encoded_references_["var_A"] is encoder._encoded_references_["var_B"]
+    )
+
+    X = encoder.transform(test)
+    for var in ["var_A", "var_B"]:
+        for ref in ["dog", "cat"]:
+            expected = [np.float32(_gpm_fast(x, ref)) for x in test[var]]
+            assert X[f"{var}_{ref}"].tolist() == expected